@@ -37,7 +37,12 @@ export default async function handler(req, res) {
   }
 
   try {
-    const { data: orders, error } = await supabase
+    // Keyset pagination: pass ?cursor=<created_at of last row> to fetch the
+    // next page. Constant-time regardless of offset, unlike .range() skips.
+    const limit = Math.min(parseInt(req.query.limit, 10) || 100, 200);
+    const { cursor } = req.query;
+
+    let query = supabase
       .from('combo_parent_orders')
       .select(`
         *,
@@ -45,13 +50,24 @@ export default async function handler(req, res) {
         logs:combo_logs(*)
       `)
       .order('created_at', { ascending: false })
-      .limit(100);
+      .limit(limit);
+
+    if (cursor) {
+      query = query.lt('created_at', cursor);
+    }
+
+    const { data: orders, error } = await query;
 
     if (error) throw error;
 
+    const nextCursor = orders && orders.length === limit
+      ? orders[orders.length - 1].created_at
+      : null;
+
     return res.status(200).json({
       success: true,
-      orders: orders || []
+      orders: orders || [],
+      next_cursor: nextCursor
     });
   } catch (err) {
     console.error('[AdminComboOrders GET] Error:', err);
@@ -29,46 +29,47 @@ export default async function handler(req, res) {
     try {
         const supabase = getServiceRoleClient();
 
-        // 1. Get Aggregated Summary
-        const { data: summaryData, error: summaryError } = await supabase
-            .from('dev_monitoring_summary')
-            .select('*')
-            .maybeSingle();
+        // All seven monitoring queries are independent — run them in parallel
+        // so the endpoint costs one round-trip of latency instead of seven.
+        const [
+            { data: summaryData, error: summaryError },          // 1. Aggregated Summary
+            { data: stuckDetails },                              // 2. Recent Stuck Orders
+            { data: criticalEvents },                            // 3. Recent Critical Events
+            { count: providerFailures30m },                      // 4. Provider Failures in last 30m
+            { data: balanceAnomalies },                          // 5. Balance Discrepancy Details
+            { count: ghostCount },                               // 6. Unresolved Ghost Orders
+            { count: suspiciousCount }                           //    Unresolved Suspicious Activity
+        ] = await Promise.all([
+            supabase
+                .from('dev_monitoring_summary')
+                .select('*')
+                .maybeSingle(),
+            supabase
+                .from('stuck_orders_monitor')
+                .select('*')
+                .limit(10),
+            supabase
+                .from('system_events')
+                .select('*')
+                .order('created_at', { ascending: false })
+                .limit(10),
+            supabase
+                .from('system_events')
+                .select('*', { count: 'exact', head: true })
+                .eq('event_type', 'provider_submission_failure')
+                .gte('created_at', new Date(Date.now() - 30 * 60000).toISOString()),
+            supabase
+                .from('ledger_balance_verification')
+                .select('*')
+                .neq('discrepancy', 0)
+                .order('discrepancy', { ascending: false })
+                .limit(1000),
+            supabase.from('security_ghost_orders').select('*', { count: 'exact', head: true }).eq('is_resolved', false),
+            supabase.from('security_suspicious_activity').select('*', { count: 'exact', head: true }).eq('is_resolved', false)
+        ]);
 
         if (summaryError) throw summaryError;
 
-        // 2. Get Recent Stuck Orders for Details
-        const { data: stuckDetails } = await supabase
-            .from('stuck_orders_monitor')
-            .select('*')
-            .limit(10);
-
-        // 3. Get Recent Critical Events
-        const { data: criticalEvents } = await supabase
-            .from('system_events')
-            .select('*')
-            .order('created_at', { ascending: false })
-            .limit(10);
-
-        // 4. Calculate Provider Failures in last 30m (specific detail)
-        const { count: providerFailures30m } = await supabase
-            .from('system_events')
-            .select('*', { count: 'exact', head: true })
-            .eq('event_type', 'provider_submission_failure')
-            .gte('created_at', new Date(Date.now() - 30 * 60000).toISOString());
-
-        // 5. Get Balance Discrepancy Details
-        const { data: balanceAnomalies } = await supabase
-            .from('ledger_balance_verification')
-            .select('*')
-            .neq('discrepancy', 0)
-            .order('discrepancy', { ascending: false })
-            .limit(1000);
-
-        // 6. Get Security & Ghost Order Stats
-        const { count: ghostCount } = await supabase.from('security_ghost_orders').select('*', { count: 'exact', head: true }).eq('is_resolved', false);
-        const { count: suspiciousCount } = await supabase.from('security_suspicious_activity').select('*', { count: 'exact', head: true }).eq('is_resolved', false);
-
         return res.status(200).json({
             success: true,
             timestamp: new Date().toISOString(),
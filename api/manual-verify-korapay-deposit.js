@@ -115,18 +115,11 @@ export default async function handler(req, res) {
     const korapayStatus = chargeData.status;
     const isSuccessful = korapayStatus === 'success';
 
-    let newStatus = transaction.status;
-    if (isSuccessful) {
-      newStatus = 'approved';
-    } else if (korapayStatus === 'failed') {
-      newStatus = 'rejected';
-    }
-
-    // Update transaction
+    // Persist the raw verify response (metadata only — the status transition
+    // and credit happen atomically below)
     await supabase
       .from('transactions')
       .update({
-        status: newStatus,
         korapay_reference: targetRef,
         korapay_status: korapayStatus,
         raw_status_check: korapayData,
@@ -134,29 +127,46 @@ export default async function handler(req, res) {
       })
       .eq('id', transaction.id);
 
-    // Credit balance if approved and was not already approved
-    if (newStatus === 'approved' && transaction.status !== 'approved') {
-      const { data: profile } = await supabase
-        .from('profiles')
-        .select('balance')
-        .eq('id', transaction.user_id)
-        .single();
-
-      if (profile) {
-        const newBalance = (parseFloat(profile.balance) || 0) + parseFloat(transaction.amount);
-        await supabase
-          .from('profiles')
-          .update({ balance: newBalance })
-          .eq('id', transaction.user_id);
-
-        await logAdminAction({
-          admin_id: adminUser.id,
-          action_type: 'manual_verify_deposit_success',
-          target_user_id: transaction.user_id,
-          description: `Admin manually verified & approved Korapay deposit of ₵${transaction.amount}`,
-          metadata: { transaction_id: transaction.id, reference: targetRef, korapayData },
-          req
-        });
+    // Approve + credit through the row-locking RPC (idempotent — a concurrent
+    // webhook/verify approval cannot double credit), or reject conditionally.
+    // newStatus only moves when a transition actually persisted, so the
+    // response always matches the DB.
+    let newStatus = transaction.status;
+    if (isSuccessful) {
+      const { data: rpcResult, error: rpcError } = await supabase.rpc('approve_deposit_transaction_universal_v2', {
+        p_transaction_id: transaction.id,
+        p_payment_method: 'korapay',
+        p_payment_status: korapayStatus,
+        p_payment_reference: targetRef
+      });
+
+      const approvalResult = rpcResult && rpcResult.length > 0 ? rpcResult[0] : null;
+
+      if (rpcError || !approvalResult?.success) {
+        console.error('Error approving transaction in manual Korapay verify:', rpcError?.message || approvalResult?.message);
+      } else {
+        newStatus = 'approved';
+        if (approvalResult.old_status !== 'approved') {
+          await logAdminAction({
+            admin_id: adminUser.id,
+            action_type: 'manual_verify_deposit_success',
+            target_user_id: transaction.user_id,
+            description: `Admin manually verified & approved Korapay deposit of ₵${transaction.amount}`,
+            metadata: { transaction_id: transaction.id, reference: targetRef, korapayData },
+            req
+          });
+        }
+      }
+    } else if (korapayStatus === 'failed') {
+      const { data: rejected } = await supabase
+        .from('transactions')
+        .update({ status: 'rejected', updated_at: new Date().toISOString() })
+        .eq('id', transaction.id)
+        .neq('status', 'approved')
+        .select('id');
+
+      if (rejected && rejected.length > 0) {
+        newStatus = 'rejected';
       }
     }
 
@@ -88,7 +88,7 @@ export default async function handler(req, res) {
         if (service_id) {
             const { data: service, error: sErr } = await supabase
                 .from('services')
-                .select('*')
+                .select('id, name, enabled, seller_only, is_combo, combo_service_id, combo_service_ids, combo_smmgen_service_ids, min_quantity, max_quantity, smmgen_service_id, smmcost_service_id, jbsmmpanel_service_id, worldofsmm_service_id, g1618_service_id, oldsmm_service_id, apiowner_service_id')
                 .eq('id', service_id)
                 .single();
 
@@ -218,7 +218,7 @@ export default async function handler(req, res) {
         } else if (package_id) {
             const { data: pkg, error: pErr } = await supabase
                 .from('promotion_packages')
-                .select('*')
+                .select('id, name, url_type, is_combo, combo_package_ids, combo_smmgen_service_ids, smmgen_service_id, smmcost_service_id, jbsmmpanel_service_id, worldofsmm_service_id, g1618_service_id, oldsmm_service_id, apiowner_service_id')
                 .eq('id', package_id)
                 .single();
 
@@ -104,10 +104,11 @@ export default async function handler(req, res) {
             newStatus = 'rejected';
         }
 
+        // Persist callback metadata only — the status transition and credit
+        // happen atomically below so this can never race with status-check.js
         const { error: updateError } = await supabase
             .from('transactions')
             .update({
-                status: newStatus,
                 hubtel_transaction_id: payload.transactionId || payload.TransactionId || responseData.transactionId || responseData.TransactionId,
                 external_transaction_id: payload.externalTransactionId || payload.ExternalTransactionId || responseData.externalTransactionId || responseData.ExternalTransactionId,
                 payment_method: payload.PaymentDetails?.Channel || responseData.PaymentDetails?.Channel || transaction.payment_method,
@@ -121,37 +122,39 @@ export default async function handler(req, res) {
             return res.status(500).json({ error: 'Internal update error' });
         }
 
-        // 5. If successful, update user balance
+        // 5. If successful, approve + credit through the row-locking RPC
+        // (idempotent — a concurrent status check cannot double credit)
         console.log(`Hubtel Callback Status for ${clientReference}: ${newStatus}`);
         if (newStatus === 'approved') {
-            const { data: profile } = await supabase
-                .from('profiles')
-                .select('balance')
-                .eq('id', transaction.user_id)
-                .single();
-
-            if (profile) {
-                const newBalance = (profile.balance || 0) + parseFloat(transaction.amount);
-                const { error: balanceError } = await supabase
-                    .from('profiles')
-                    .update({ balance: newBalance })
-                    .eq('id', transaction.user_id);
-
-                if (balanceError) {
-                    console.error('Error updating balance in Hubtel callback:', balanceError);
-                } else {
-                    // Log completion
-                    await logUserAction({
-                        user_id: transaction.user_id,
-                        action_type: 'deposit_completed',
-                        entity_type: 'transaction',
-                        entity_id: transaction.id,
-                        description: `Hubtel deposit completed: ₵${transaction.amount}`,
-                        metadata: { hubtel_transaction_id: payload.TransactionId },
-                        req
-                    });
-                }
+            const { data: rpcResult, error: rpcError } = await supabase.rpc('approve_deposit_transaction_universal_v2', {
+                p_transaction_id: transaction.id,
+                p_payment_method: 'hubtel',
+                p_payment_status: hubtelStatus,
+                p_payment_reference: clientReference
+            });
+
+            const approvalResult = rpcResult && rpcResult.length > 0 ? rpcResult[0] : null;
+
+            if (rpcError || !approvalResult?.success) {
+                console.error('Error crediting balance in Hubtel callback:', rpcError?.message || approvalResult?.message);
+            } else if (approvalResult.old_status !== 'approved') {
+                // Log completion only when this call performed the credit
+                await logUserAction({
+                    user_id: transaction.user_id,
+                    action_type: 'deposit_completed',
+                    entity_type: 'transaction',
+                    entity_id: transaction.id,
+                    description: `Hubtel deposit completed: ₵${transaction.amount}`,
+                    metadata: { hubtel_transaction_id: payload.TransactionId },
+                    req
+                });
             }
+        } else if (newStatus === 'rejected') {
+            await supabase
+                .from('transactions')
+                .update({ status: 'rejected', updated_at: new Date().toISOString() })
+                .eq('id', transaction.id)
+                .neq('status', 'approved');
         }
 
         // Return 200 OK to Hubtel immediately
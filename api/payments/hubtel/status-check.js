@@ -166,19 +166,11 @@ export default async function handler(req, res) {
                 (responseCode === '0000' && transactionStatus && transactionStatus !== 'Unpaid' && transactionStatus !== 'Failed');
         }
 
-        // 6. Determine new status and update DB
-        let newStatus = transaction.status;
-        if (isSuccessful) {
-            newStatus = 'approved';
-        } else if (transactionStatus === 'Failed' || transactionStatus === 'Unpaid' || responseCode === '2001') {
-            newStatus = 'rejected';
-        }
-
-        // Update transaction record
+        // Persist status-check metadata only — the status transition and credit
+        // happen atomically below so this can never race with the callback
         const { error: updateError } = await supabase
             .from('transactions')
             .update({
-                status: newStatus,
                 hubtel_transaction_id: responseData.transactionId || responseData.TransactionId || hubtelData.transactionId || hubtelData.TransactionId || responseData.checkoutId,
                 raw_status_check: hubtelData,
                 updated_at: new Date().toISOString()
@@ -190,46 +182,49 @@ export default async function handler(req, res) {
             console.error('Error updating transaction status:', updateError);
         }
 
-        // If payment was success and we changed status, increment user balance
-        console.log(`Updating status to ${newStatus}. Current status: ${transaction.status}`);
-        if (newStatus === 'approved' && transaction.status !== 'approved') {
-            const { data: profile, error: profileError } = await supabase
-                .from('profiles')
-                .select('balance')
-                .eq('id', user.id)
-                .single();
-
-            if (profileError) {
-                console.error('Error fetching profile for balance update:', profileError);
-            }
-
-            if (profile) {
-                const currentBalance = parseFloat(profile.balance || 0);
-                const depositAmount = parseFloat(transaction.amount || 0);
-                const newBalance = currentBalance + depositAmount;
-
-                console.log(`Updating balance for user ${user.id}: ${currentBalance} + ${depositAmount} = ${newBalance}`);
+        // 6. Apply the result atomically. Success goes through the row-locking
+        // approval RPC (idempotent — a concurrent callback cannot double
+        // credit); newStatus only moves when a transition actually persisted,
+        // so the response always matches the DB.
+        let newStatus = transaction.status;
+        console.log(`Hubtel status check outcome: successful=${isSuccessful}, status=${transactionStatus}. Current status: ${transaction.status}`);
+        if (isSuccessful) {
+            const { data: rpcResult, error: rpcError } = await supabase.rpc('approve_deposit_transaction_universal_v2', {
+                p_transaction_id: transaction.id,
+                p_payment_method: 'hubtel',
+                p_payment_status: transactionStatus,
+                p_payment_reference: clientReference
+            });
 
-                const { error: profileUpdateError } = await supabase
-                    .from('profiles')
-                    .update({ balance: newBalance })
-                    .eq('id', user.id);
+            const approvalResult = rpcResult && rpcResult.length > 0 ? rpcResult[0] : null;
 
-                if (profileUpdateError) {
-                    console.error('Error updating profile balance:', profileUpdateError);
-                } else {
+            if (rpcError || !approvalResult?.success) {
+                console.error('Error crediting balance in Hubtel status check:', rpcError?.message || approvalResult?.message);
+            } else {
+                newStatus = 'approved';
+                if (approvalResult.old_status !== 'approved') {
                     console.log('Balance updated successfully');
+                    await logUserAction({
+                        user_id: user.id,
+                        action_type: 'deposit_completed',
+                        entity_type: 'transaction',
+                        entity_id: transaction.id,
+                        description: `Hubtel deposit completed via status check: ₵${transaction.amount}`,
+                        metadata: { hubtelData },
+                        req
+                    });
                 }
-
-                await logUserAction({
-                    user_id: user.id,
-                    action_type: 'deposit_completed',
-                    entity_type: 'transaction',
-                    entity_id: transaction.id,
-                    description: `Hubtel deposit completed via status check: ₵${transaction.amount}`,
-                    metadata: { hubtelData },
-                    req
-                });
+            }
+        } else if (transactionStatus === 'Failed' || transactionStatus === 'Unpaid' || responseCode === '2001') {
+            const { data: rejected } = await supabase
+                .from('transactions')
+                .update({ status: 'rejected', updated_at: new Date().toISOString() })
+                .eq('id', transaction.id)
+                .neq('status', 'approved')
+                .select('id');
+
+            if (rejected && rejected.length > 0) {
+                newStatus = 'rejected';
             }
         }
 
@@ -125,18 +125,11 @@ export default async function handler(req, res) {
         const korapayStatus = chargeData.status;
         const isSuccessful = korapayStatus === 'success';
 
-        // 6. Update transaction
-        let newStatus = transaction.status;
-        if (isSuccessful) {
-            newStatus = 'approved';
-        } else if (korapayStatus === 'failed') {
-            newStatus = 'rejected';
-        }
-
+        // 6. Persist the raw verify response (metadata only — status transitions
+        // happen atomically below so this can never race with the webhook)
         await supabase
             .from('transactions')
             .update({
-                status: newStatus,
                 korapay_reference: reference,
                 korapay_status: korapayStatus,
                 raw_status_check: korapayData,
@@ -144,24 +137,26 @@ export default async function handler(req, res) {
             })
             .eq('id', transaction.id);
 
-        // 7. Credit user balance if now approved (and wasn't already)
-        if (newStatus === 'approved' && transaction.status !== 'approved') {
-            const { data: profile } = await supabase
-                .from('profiles')
-                .select('balance')
-                .eq('id', user.id)
-                .single();
-
-            if (profile) {
-                const newBalance = (parseFloat(profile.balance) || 0) + parseFloat(transaction.amount);
-                const { error: balanceError } = await supabase
-                    .from('profiles')
-                    .update({ balance: newBalance })
-                    .eq('id', user.id);
-
-                if (balanceError) {
-                    console.error('Error updating balance in KoraPay verify:', balanceError);
-                } else {
+        // 7. Apply the result atomically. Success goes through the row-locking
+        // approval RPC (idempotent — if the webhook already approved, no double
+        // credit). Failure only rejects if the webhook hasn't approved meanwhile.
+        let newStatus = transaction.status;
+        if (isSuccessful) {
+            const { data: rpcResult, error: rpcError } = await supabase.rpc('approve_deposit_transaction_universal_v2', {
+                p_transaction_id: transaction.id,
+                p_payment_method: 'korapay',
+                p_payment_status: korapayStatus,
+                p_payment_reference: reference
+            });
+
+            const approvalResult = rpcResult && rpcResult.length > 0 ? rpcResult[0] : null;
+
+            if (rpcError || !approvalResult?.success) {
+                console.error('Error approving transaction in KoraPay verify:', rpcError?.message || approvalResult?.message);
+            } else {
+                newStatus = 'approved';
+                if (approvalResult.old_status !== 'approved') {
+                    // This call performed the actual credit
                     await logUserAction({
                         user_id: user.id,
                         action_type: 'deposit_completed',
@@ -173,6 +168,17 @@ export default async function handler(req, res) {
                     });
                 }
             }
+        } else if (korapayStatus === 'failed') {
+            const { data: rejected } = await supabase
+                .from('transactions')
+                .update({ status: 'rejected', updated_at: new Date().toISOString() })
+                .eq('id', transaction.id)
+                .neq('status', 'approved')
+                .select('id');
+
+            if (rejected && rejected.length > 0) {
+                newStatus = 'rejected';
+            }
         }
 
         return res.status(200).json({
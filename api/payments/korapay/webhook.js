@@ -111,10 +111,11 @@ export default async function handler(req, res) {
         const isSuccessful = korapayStatus === 'success';
         const newStatus = isSuccessful ? 'approved' : 'rejected';
 
+        // Persist the raw callback (metadata only — the status transition and
+        // credit happen atomically below so this can never race with verify.js)
         const { error: updateError } = await supabase
             .from('transactions')
             .update({
-                status: newStatus,
                 korapay_reference: reference,
                 korapay_status: korapayStatus,
                 raw_callback: payload,
@@ -127,34 +128,48 @@ export default async function handler(req, res) {
             return res.status(500).json({ error: 'Internal update error' });
         }
 
-        // 6. Credit user balance if successful
-        if (newStatus === 'approved') {
-            const { data: profile } = await supabase
-                .from('profiles')
-                .select('balance')
-                .eq('id', transaction.user_id)
-                .single();
-
-            if (profile) {
-                const newBalance = (parseFloat(profile.balance) || 0) + parseFloat(transaction.amount);
-                const { error: balanceError } = await supabase
-                    .from('profiles')
-                    .update({ balance: newBalance })
-                    .eq('id', transaction.user_id);
-
-                if (balanceError) {
-                    console.error('Error updating balance in KoraPay webhook:', balanceError);
-                } else {
-                    await logUserAction({
-                        user_id: transaction.user_id,
-                        action_type: 'deposit_completed',
-                        entity_type: 'transaction',
-                        entity_id: transaction.id,
-                        description: `KoraPay deposit completed via webhook: ₵${transaction.amount}`,
-                        metadata: { reference, korapay_status: korapayStatus }
-                    });
-                }
+        // 6. Approve + credit through the row-locking RPC (idempotent — if the
+        // redirect verify already approved, no double credit), or reject only
+        // if not already approved.
+        if (isSuccessful) {
+            const { data: rpcResult, error: rpcError } = await supabase.rpc('approve_deposit_transaction_universal_v2', {
+                p_transaction_id: transaction.id,
+                p_payment_method: 'korapay',
+                p_payment_status: korapayStatus,
+                p_payment_reference: reference
+            });
+
+            const approvalResult = rpcResult && rpcResult.length > 0 ? rpcResult[0] : null;
+
+            if (rpcError) {
+                console.error('Error crediting balance in KoraPay webhook:', rpcError.message);
+                // 500 makes KoraPay retry the webhook; the RPC is idempotent so a retry is safe
+                return res.status(500).json({ error: 'Internal update error' });
+            }
+
+            if (!approvalResult?.success) {
+                // Permanent refusal (e.g. expired or non-deposit transaction) —
+                // acknowledge with 200 so KoraPay doesn't retry forever
+                console.error('KoraPay webhook approval refused:', approvalResult?.message);
+                return res.status(200).json({ success: false, message: approvalResult?.message || 'Approval refused' });
+            }
+
+            if (approvalResult.old_status !== 'approved') {
+                await logUserAction({
+                    user_id: transaction.user_id,
+                    action_type: 'deposit_completed',
+                    entity_type: 'transaction',
+                    entity_id: transaction.id,
+                    description: `KoraPay deposit completed via webhook: ₵${transaction.amount}`,
+                    metadata: { reference, korapay_status: korapayStatus }
+                });
             }
+        } else {
+            await supabase
+                .from('transactions')
+                .update({ status: 'rejected', updated_at: new Date().toISOString() })
+                .eq('id', transaction.id)
+                .neq('status', 'approved');
         }
 
         console.log(`KoraPay webhook processed: ${reference} → ${newStatus}`);
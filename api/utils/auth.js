@@ -9,6 +9,17 @@ import { createClient } from '@supabase/supabase-js';
 import jwt from 'jsonwebtoken';
 import { getCached, setCached } from './redisClient.js';
 
+// Resolve credentials and verification key material once at module load
+// instead of re-reading process.env on every request
+const SUPABASE_URL = process.env.SUPABASE_URL || process.env.REACT_APP_SUPABASE_URL;
+const SUPABASE_ANON_KEY = process.env.SUPABASE_ANON_KEY || process.env.REACT_APP_SUPABASE_ANON_KEY;
+const JWT_SECRET = process.env.SUPABASE_JWT_SECRET;
+
+const ALLOWED_ORIGINS = [
+  'https://boostupgh.com',
+  'https://www.boostupgh.com'
+];
+
 /**
  * Verify Supabase JWT token from request and return authenticated user
  * Optimized to perform local verification to save API calls
@@ -27,24 +38,20 @@ export async function verifyAuth(req) {
     throw new Error('Missing or invalid authentication (no Bearer token provided in Authorization header)');
   }
 
-  const supabaseUrl = process.env.SUPABASE_URL || process.env.REACT_APP_SUPABASE_URL;
-  const supabaseAnonKey = process.env.SUPABASE_ANON_KEY || process.env.REACT_APP_SUPABASE_ANON_KEY;
-  const jwtSecret = process.env.SUPABASE_JWT_SECRET;
-
-  if (!supabaseUrl || !supabaseAnonKey) {
+  if (!SUPABASE_URL || !SUPABASE_ANON_KEY) {
     throw new Error('Supabase credentials not configured');
   }
 
-  const supabase = createClient(supabaseUrl, supabaseAnonKey, {
+  const supabase = createClient(SUPABASE_URL, SUPABASE_ANON_KEY, {
     global: { headers: { Authorization: `Bearer ${token}` } },
     auth: { autoRefreshToken: false, persistSession: false }
   });
 
   // Verify token
   let user = null;
-  if (jwtSecret) {
+  if (JWT_SECRET) {
     try {
-      const decoded = jwt.verify(token, jwtSecret);
+      const decoded = jwt.verify(token, JWT_SECRET);
       if (decoded && decoded.sub) {
         user = {
           id: decoded.sub,
@@ -77,18 +84,13 @@ export async function verifyAuth(req) {
   const reqOrigin = req.headers.origin;
   const reqReferer = req.headers.referer;
 
-  const allowedOrigins = [
-    'https://boostupgh.com',
-    'https://www.boostupgh.com'
-  ];
-
   const isLocalHost = (url) => {
     if (!url) return false;
     return url.includes('localhost') || url.includes('127.0.0.1') || url.includes('::1');
   };
 
-  const hasValidOrigin = reqOrigin && (allowedOrigins.includes(reqOrigin) || isLocalHost(reqOrigin));
-  const hasValidReferer = reqReferer && (allowedOrigins.some(ao => reqReferer.startsWith(ao)) || isLocalHost(reqReferer));
+  const hasValidOrigin = reqOrigin && (ALLOWED_ORIGINS.includes(reqOrigin) || isLocalHost(reqOrigin));
+  const hasValidReferer = reqReferer && (ALLOWED_ORIGINS.some(ao => reqReferer.startsWith(ao)) || isLocalHost(reqReferer));
 
   if (!hasValidOrigin && !hasValidReferer) {
     throw new Error('Access denied: Invalid request origin. Access is only permitted from the official web interface.');
@@ -194,18 +196,17 @@ export async function verifyTransactionOwner(req, transactionId) {
  * @returns {Object} - Supabase client with service role
  */
 export function getServiceRoleClient() {
-  const supabaseUrl = process.env.SUPABASE_URL || process.env.REACT_APP_SUPABASE_URL;
   let supabaseKey = process.env.SUPABASE_SERVICE_ROLE_KEY;
 
   if (!supabaseKey || supabaseKey.includes('PLACEHOLDER')) {
-    supabaseKey = process.env.SUPABASE_ANON_KEY || process.env.REACT_APP_SUPABASE_ANON_KEY;
+    supabaseKey = SUPABASE_ANON_KEY;
   }
 
-  if (!supabaseUrl || !supabaseKey) {
+  if (!SUPABASE_URL || !supabaseKey) {
     throw new Error('Supabase credentials not configured');
   }
 
-  return createClient(supabaseUrl, supabaseKey, {
+  return createClient(SUPABASE_URL, supabaseKey, {
     auth: {
       autoRefreshToken: false,
       persistSession: false
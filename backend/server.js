@@ -3,9 +3,16 @@ const cors = require('cors');
 const compression = require('compression');
 const rateLimit = require('express-rate-limit');
 const axios = require('axios');
+const http = require('http');
+const https = require('https');
 const { createClient } = require('@supabase/supabase-js');
 require('dotenv').config();
 
+// Reuse pooled keep-alive connections for all outbound provider/API calls
+// instead of paying a fresh TCP+TLS handshake per request
+axios.defaults.httpAgent = new http.Agent({ keepAlive: true, maxSockets: 50, maxFreeSockets: 10 });
+axios.defaults.httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 50, maxFreeSockets: 10 });
+
 const app = express();
 const PORT = process.env.PORT || 5000;
 
@@ -63,6 +70,22 @@ const getCachedResponse = async (key) => {
   return await getCached(`smmgen:${key}`);
 };
 
+// Serialize once and answer conditional GETs with a content-hash ETag.
+// A matching If-None-Match returns an empty 304 instead of re-sending
+// (and re-encoding) the multi-KB services payload.
+const crypto = require('crypto');
+const sendJsonWithEtag = (req, res, data, extraHeaders = {}) => {
+  const body = JSON.stringify(data);
+  const etag = `"${crypto.createHash('sha1').update(body).digest('hex')}"`;
+
+  res.set({ ...extraHeaders, 'ETag': etag });
+
+  if (req.headers['if-none-match'] === etag) {
+    return res.status(304).end();
+  }
+  res.type('application/json').send(body);
+};
+
 // Helper function to set cached response in Upstash Redis
 const setCachedResponse = async (key, data) => {
   await setCached(`smmgen:${key}`, data, CACHE_TTL[key] || 300);
@@ -80,12 +103,10 @@ app.post('/api/smmgen/services', async (req, res) => {
     // Check Redis cache first
     const cached = await getCachedResponse('services');
     if (cached) {
-      res.set({
+      return sendJsonWithEtag(req, res, cached, {
         'Cache-Control': 'public, max-age=600',
-        'X-Cache': 'HIT',
-        'ETag': `"${Date.now()}"`
+        'X-Cache': 'HIT'
       });
-      return res.json(cached);
     }
 
     // SMMGen API typically uses POST with action parameter
@@ -102,13 +123,11 @@ app.post('/api/smmgen/services', async (req, res) => {
     // Cache the response in Upstash Redis
     await setCachedResponse('services', response.data);
 
-    res.set({
+    sendJsonWithEtag(req, res, response.data, {
       'Cache-Control': 'public, max-age=600',
       'X-Cache': 'MISS',
-      'ETag': `"${Date.now()}"`,
       'Last-Modified': new Date().toUTCString()
     });
-    res.json(response.data);
   } catch (error) {
     console.error('SMMGen services error:', error.response?.data || error.message);
     const statusCode = error.response?.status || (error.code === 'ECONNABORTED' ? 504 : 500);
@@ -740,12 +759,15 @@ app.post('/api/check-orders-status', async (req, res) => {
     }
 
     // Batch update order statuses in database
+    // One timestamp for the whole batch — the checks all happened in this
+    // pass, and it avoids re-formatting the date per row
+    const checkedAt = new Date().toISOString();
     let updatedCount = 0;
     if (updates.length > 0) {
       for (const update of updates) {
         const updatePayload = {
           status: update.status,
-          last_status_check: new Date().toISOString()
+          last_status_check: checkedAt
         };
 
         if (update.component_provider_order_ids) {
@@ -770,7 +792,7 @@ app.post('/api/check-orders-status', async (req, res) => {
     if (unchangedIds.length > 0) {
       await dbClient
         .from('orders')
-        .update({ last_status_check: new Date().toISOString() })
+        .update({ last_status_check: checkedAt })
         .in('id', unchangedIds);
     }
 
@@ -814,10 +836,37 @@ app.post('/api/reward/check-reward-eligibility', async (req, res) => {
 
     const today = new Date().toISOString().split('T')[0];
 
-    const { data: settings, error: settingsError } = await supabase
-      .from('reward_settings')
-      .select('daily_deposit_limit')
-      .single();
+    // Settings, deposits, claims and tiers are independent lookups — fetch
+    // them in parallel instead of serializing four round-trips
+    const [
+      { data: settings, error: settingsError },
+      { data: deposits, error: depositsError },
+      { data: claims, error: claimError },
+      { data: tiers, error: tiersError }
+    ] = await Promise.all([
+      supabase
+        .from('reward_settings')
+        .select('daily_deposit_limit')
+        .single(),
+      supabase
+        .from('transactions')
+        .select('amount')
+        .eq('user_id', user.id)
+        .eq('type', 'deposit')
+        .eq('status', 'approved')
+        .gte('created_at', `${today}T00:00:00Z`)
+        .lte('created_at', `${today}T23:59:59Z`),
+      supabase
+        .from('daily_reward_claims')
+        .select('tier_id')
+        .eq('user_id', user.id)
+        .eq('claim_date', today),
+      supabase
+        .from('reward_tiers')
+        .select('*')
+        .order('position', { ascending: true })
+        .order('required_amount', { ascending: true }) // Fallback sort
+    ]);
 
     if (settingsError || !settings) {
       return res.status(500).json({ error: 'Failed to fetch reward settings' });
@@ -825,34 +874,12 @@ app.post('/api/reward/check-reward-eligibility', async (req, res) => {
 
     const requiredDeposit = parseFloat(settings.daily_deposit_limit);
 
-    const { data: deposits, error: depositsError } = await supabase
-      .from('transactions')
-      .select('amount')
-      .eq('user_id', user.id)
-      .eq('type', 'deposit')
-      .eq('status', 'approved')
-      .gte('created_at', `${today}T00:00:00Z`)
-      .lte('created_at', `${today}T23:59:59Z`);
-
     if (depositsError) throw depositsError;
 
     const totalDeposits = deposits?.reduce((sum, d) => sum + parseFloat(d.amount), 0) || 0;
 
-    const { data: claims, error: claimError } = await supabase
-      .from('daily_reward_claims')
-      .select('*')
-      .eq('user_id', user.id)
-      .eq('claim_date', today);
-
     if (claimError) throw claimError;
 
-    // Fetch all active reward tiers
-    const { data: tiers, error: tiersError } = await supabase
-      .from('reward_tiers')
-      .select('*')
-      .order('position', { ascending: true })
-      .order('required_amount', { ascending: true }); // Fallback sort
-
     if (tiersError) throw tiersError;
 
     // If no tiers exist, fall back to legacy logic or return error
@@ -924,39 +951,42 @@ app.post('/api/reward/claim-reward', async (req, res) => {
 
     const today = new Date().toISOString().split('T')[0];
 
-    // 1. Fetch the specific Tier
-    const { data: tier, error: tierError } = await supabase
-      .from('reward_tiers')
-      .select('*')
-      .eq('id', tier_id)
-      .single();
+    // 1-3. Tier, deposits and existing-claim lookups are independent (all
+    // keyed on ids from the request) — fetch them in parallel
+    const [
+      { data: tier, error: tierError },
+      { data: deposits },
+      { data: existingClaim, error: claimCheckError }
+    ] = await Promise.all([
+      supabase
+        .from('reward_tiers')
+        .select('*')
+        .eq('id', tier_id)
+        .single(),
+      supabase.from('transactions')
+        .select('amount')
+        .eq('user_id', user.id).eq('type', 'deposit').eq('status', 'approved')
+        .gte('created_at', `${today}T00:00:00Z`).lte('created_at', `${today}T23:59:59Z`),
+      supabase
+        .from('daily_reward_claims')
+        .select('id')
+        .eq('user_id', user.id)
+        .eq('claim_date', today)
+        .eq('tier_id', tier_id) // Check specific tier
+        .maybeSingle()
+    ]);
 
     if (tierError || !tier) return res.status(404).json({ error: 'Reward tier not found' });
 
     const requiredAmount = parseFloat(tier.required_amount);
     const rewardAmount = reward_type === 'views' ? tier.reward_views : tier.reward_likes;
 
-    // 2. Verify Deposits
-    const { data: deposits } = await supabase.from('transactions')
-      .select('amount')
-      .eq('user_id', user.id).eq('type', 'deposit').eq('status', 'approved')
-      .gte('created_at', `${today}T00:00:00Z`).lte('created_at', `${today}T23:59:59Z`);
-
     const totalDeposits = deposits?.reduce((sum, d) => sum + parseFloat(d.amount), 0) || 0;
 
     if (totalDeposits < requiredAmount) {
       return res.status(400).json({ error: `Insufficient deposits for this tier. Need GHS ${requiredAmount}` });
     }
 
-    // 3. Check for EXISTING claim for THIS tier
-    const { data: existingClaim, error: claimCheckError } = await supabase
-      .from('daily_reward_claims')
-      .select('id')
-      .eq('user_id', user.id)
-      .eq('claim_date', today)
-      .eq('tier_id', tier_id) // Check specific tier
-      .maybeSingle();
-
     if (existingClaim) return res.status(400).json({ error: 'You have already claimed this reward tier today' });
 
     // 4. Insert Claim
@@ -1098,11 +1128,13 @@ app.post('/api/admin/update-reward-limit', async (req, res) => {
     const { data: current } = await supabase.from('reward_settings').select('*').single();
     const oldLimit = parseFloat(current.daily_deposit_limit);
 
-    await supabase.from('reward_settings').update({
-      daily_deposit_limit: newLimit, updated_by: user.id, updated_at: new Date().toISOString()
-    }).eq('id', current.id);
-
-    await supabase.from('reward_setting_logs').insert({ admin_id: user.id, old_value: oldLimit, new_value: newLimit });
+    // The settings update and the audit log insert are independent writes
+    await Promise.all([
+      supabase.from('reward_settings').update({
+        daily_deposit_limit: newLimit, updated_by: user.id, updated_at: new Date().toISOString()
+      }).eq('id', current.id),
+      supabase.from('reward_setting_logs').insert({ admin_id: user.id, old_value: oldLimit, new_value: newLimit })
+    ]);
 
     res.json({ success: true, message: 'Limit updated' });
   } catch (error) {
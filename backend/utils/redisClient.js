@@ -26,12 +26,40 @@ try {
   redis = null;
 }
 
+// In-process TTL cache layered in front of Upstash. The proxy server is a
+// long-lived process and every Upstash REST call is an HTTP round-trip, so
+// read-heavy/write-rare keys (e.g. the services list) are served from local
+// memory within the same TTL. Bounded so it cannot grow unchecked.
+const MEMORY_CACHE_MAX_ENTRIES = 500;
+const memoryCache = new Map();
+
+function getFromMemory(key) {
+  const entry = memoryCache.get(key);
+  if (!entry) return null;
+  if (Date.now() > entry.expiresAt) {
+    memoryCache.delete(key);
+    return null;
+  }
+  return entry.value;
+}
+
+function setInMemory(key, value, ttlSeconds) {
+  if (memoryCache.size >= MEMORY_CACHE_MAX_ENTRIES && !memoryCache.has(key)) {
+    // Evict the oldest entry (Map preserves insertion order)
+    memoryCache.delete(memoryCache.keys().next().value);
+  }
+  memoryCache.set(key, { value, expiresAt: Date.now() + ttlSeconds * 1000 });
+}
+
 /**
- * Get cached item from Redis
+ * Get cached item (in-process memory first, then Redis)
  * @param {string} key
  * @returns {Promise<any|null>}
  */
 async function getCached(key) {
+  const local = getFromMemory(key);
+  if (local !== null) return local;
+
   if (!redis) return null;
   try {
     const data = await redis.get(key);
@@ -44,12 +72,14 @@ async function getCached(key) {
 }
 
 /**
- * Set item in Redis with TTL
+ * Set item in memory and Redis with TTL
  * @param {string} key
  * @param {any} value
  * @param {number} ttlSeconds
  */
 async function setCached(key, value, ttlSeconds = 300) {
+  setInMemory(key, value, ttlSeconds);
+
   if (!redis) return;
   try {
     const stringified = typeof value === 'object' ? JSON.stringify(value) : value;
@@ -60,10 +90,12 @@ async function setCached(key, value, ttlSeconds = 300) {
 }
 
 /**
- * Delete cached item from Redis
+ * Delete cached item from memory and Redis
  * @param {string} key
  */
 async function deleteCached(key) {
+  memoryCache.delete(key);
+
   if (!redis) return;
   try {
     await redis.del(key);
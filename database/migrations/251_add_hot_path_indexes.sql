@@ -0,0 +1,22 @@
+-- Migration 251: Add Missing Indexes for Hot API Query Paths
+-- Covers the per-request lookups issued by api/order/create.js, the reward
+-- endpoints in backend/server.js, and scripts/sync_all_combo_services_to_main_services.js
+-- so they stay index-backed as tables grow instead of degrading to sequential scans.
+--
+-- Only genuinely new indexes live here. The idempotency-key lookup, daily
+-- reward claim lookup, platform filter, and system-event scan are already
+-- covered by existing indexes (see docs/PERFORMANCE_BACKLOG_NOTES.md,
+-- chunk0-3 entry).
+
+-- Duplicate active order check (same user + service + link with an active status).
+-- Partial index keeps it small: only active orders are ever matched.
+CREATE INDEX IF NOT EXISTS idx_orders_active_dup_check
+ON public.orders(user_id, service_id, link)
+WHERE status IN ('pending', 'processing', 'in progress');
+
+-- Reward eligibility: approved deposits per user within a day window
+CREATE INDEX IF NOT EXISTS idx_transactions_user_type_status_created
+ON public.transactions(user_id, type, status, created_at DESC);
+
+-- Combo service mirror lookups (scripts/sync_all_combo_services_to_main_services.js)
+CREATE INDEX IF NOT EXISTS idx_services_combo_service_id ON public.services(combo_service_id);
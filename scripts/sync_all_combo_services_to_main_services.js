@@ -35,55 +35,73 @@ async function inspectAndSync() {
 
   console.log(`Found ${combos?.length || 0} combo service(s) in combo_services table.`);
 
-  for (const combo of combos || []) {
-    console.log(`Syncing Combo: ${combo.name} (ID: ${combo.id})`);
-    
-    // Check if already mirrored in services table
-    const { data: existingSvc } = await supabase
-      .from('services')
-      .select('id')
-      .eq('combo_service_id', combo.id)
-      .single();
-
-    const insertPayload = {
-      name: combo.name,
-      platform: 'tiktok',
-      rate: combo.selling_price,
-      min_quantity: combo.min_order,
-      max_quantity: combo.max_order,
-      description: combo.description,
-      enabled: combo.status === 'active',
-      seller_only: false,
-      is_combo: true,
-      combo_service_id: combo.id
-    };
-
-    if (existingSvc) {
-      console.log(`  Updating existing main service ID: ${existingSvc.id}...`);
-      const { error: updErr } = await supabase
-        .from('services')
-        .update(insertPayload)
-        .eq('id', existingSvc.id);
-
-      if (updErr) console.error('  Update error:', updErr.message);
-      else console.log('  Updated successfully!');
-    } else {
-      console.log(`  Inserting new main service entry...`);
-      const { data: newSvc, error: insErr } = await supabase
+  if (!combos || combos.length === 0) return;
+
+  // Check which combos are already mirrored in services in ONE query
+  // (instead of a per-combo existence round-trip)
+  const comboIds = combos.map(c => c.id);
+  const { data: existingSvcs, error: existingErr } = await supabase
+    .from('services')
+    .select('id, combo_service_id')
+    .in('combo_service_id', comboIds);
+
+  if (existingErr) {
+    console.error('Error fetching existing mirrored services:', existingErr.message);
+    return;
+  }
+
+  const existingByComboId = new Map((existingSvcs || []).map(s => [s.combo_service_id, s.id]));
+
+  const buildPayload = (combo) => ({
+    name: combo.name,
+    platform: 'tiktok',
+    rate: combo.selling_price,
+    min_quantity: combo.min_order,
+    max_quantity: combo.max_order,
+    description: combo.description,
+    enabled: combo.status === 'active',
+    seller_only: false,
+    is_combo: true,
+    combo_service_id: combo.id
+  });
+
+  const toInsert = combos.filter(c => !existingByComboId.has(c.id));
+  const toUpdate = combos.filter(c => existingByComboId.has(c.id));
+
+  // Update existing mirrors (updates need per-row filters, but run them concurrently)
+  if (toUpdate.length > 0) {
+    console.log(`Updating ${toUpdate.length} existing main service entr(ies)...`);
+    const updateResults = await Promise.all(toUpdate.map(combo =>
+      supabase
         .from('services')
-        .insert(insertPayload)
-        .select()
-        .single();
-
-      if (insErr) {
-        console.error('  Insert error:', insErr.message);
-      } else if (newSvc) {
-        console.log(`  SUCCESS! Created main service entry ID: ${newSvc.id}!`);
-        await supabase
+        .update(buildPayload(combo))
+        .eq('id', existingByComboId.get(combo.id))
+    ));
+    updateResults.forEach((r, i) => {
+      if (r.error) console.error(`  Update error (${toUpdate[i].name}):`, r.error.message);
+    });
+    console.log('  Updates complete.');
+  }
+
+  // Insert all new mirrors in a single bulk insert
+  if (toInsert.length > 0) {
+    console.log(`Inserting ${toInsert.length} new main service entr(ies) in one batch...`);
+    const { data: newSvcs, error: insErr } = await supabase
+      .from('services')
+      .insert(toInsert.map(buildPayload))
+      .select('id, combo_service_id');
+
+    if (insErr) {
+      console.error('  Bulk insert error:', insErr.message);
+    } else if (newSvcs) {
+      console.log(`  SUCCESS! Created ${newSvcs.length} main service entr(ies).`);
+      // Backfill service_id links on combo_services concurrently
+      await Promise.all(newSvcs.map(svc =>
+        supabase
           .from('combo_services')
-          .update({ service_id: newSvc.id })
-          .eq('id', combo.id);
-      }
+          .update({ service_id: svc.id })
+          .eq('id', svc.combo_service_id)
+      ));
     }
   }
 }
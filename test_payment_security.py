@@ -1,16 +1,37 @@
 import requests
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://boost-social-4.preview.emergentagent.com/api"
 
+# Shared keep-alive session so both tests reuse one TLS connection.
+# Tuned adapter: sized connection pool plus retries on transient 5xx so a
+# flaky gateway response doesn't fail the whole run.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(['GET', 'POST', 'PUT'])
+    )
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+SESSION.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip, br'})
+
 def test_unauthenticated_approval():
     print("Testing unauthenticated approval...")
     data = {
         "transaction_id": str(uuid.uuid4()),
         "payment_method": "paystack"
     }
-    response = requests.post(f"{BASE_URL}/approve-deposit-universal", json=data)
+    response = SESSION.post(f"{BASE_URL}/approve-deposit-universal", json=data)
     print(f"Response: {response.status_code}")
     if response.status_code == 401:
         print("✅ SUCCESS: Unauthenticated request correctly blocked (401)")
@@ -24,7 +45,7 @@ def test_unauthenticated_init():
         "reference": "test-ref",
         "customer": {"email": "test@test.com"}
     }
-    response = requests.post(f"{BASE_URL}/korapay-init", json=data)
+    response = SESSION.post(f"{BASE_URL}/korapay-init", json=data)
     print(f"Response: {response.status_code}")
     if response.status_code == 401:
         print("✅ SUCCESS: Unauthenticated initialization correctly blocked (401)")
@@ -33,7 +54,14 @@ def test_unauthenticated_init():
 
 if __name__ == "__main__":
     try:
-        test_unauthenticated_approval()
-        test_unauthenticated_init()
+        # Independent checks, so fan them out over the shared session
+        # (urllib3's connection pool is thread-safe)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(test_unauthenticated_approval),
+                executor.submit(test_unauthenticated_init),
+            ]
+            for future in futures:
+                future.result()
     except Exception as e:
         print(f"Error during testing: {e}")